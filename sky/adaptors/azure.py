@@ -3,12 +3,23 @@
 # pylint: disable=import-outside-toplevel
 import asyncio
 import datetime
+import functools
+import json
 import logging
+import os
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 import uuid
 
+import filelock
+
+try:
+    # fastrlock is an optional, faster drop-in for the uncontended case.
+    from fastrlock.rlock import RLock as _RLock
+except ImportError:
+    from threading import RLock as _RLock  # type: ignore
+
 from sky import exceptions as sky_exceptions
 from sky import sky_logging
 from sky.adaptors import common
@@ -28,8 +39,29 @@ sky_logger = sky_logging.init_logger(__name__)
 
 _LAZY_MODULES = (azure,)
 
-_session_creation_lock = threading.RLock()
+_session_creation_lock = _RLock()
 _MAX_RETRY_FOR_GET_SUBSCRIPTION_ID = 5
+# SAS tokens are cached per bucket of this length and expire two buckets
+# after the end of it, so a cached token still lives for at least an hour,
+# e.g. for long running `azcopy sync` on remote nodes.
+_SAS_EXPIRY_BUCKET_SECONDS = 30 * 60
+_MANAGEMENT_SCOPE = 'https://management.azure.com/.default'
+# Cached access tokens are refreshed when they expire within this time.
+_TOKEN_REFRESH_MARGIN_SECONDS = 5 * 60
+# Containers found to be private, persisted across processes to skip the
+# failing anonymous request on them.
+_CONTAINER_AUTH_CACHE_PATH = '~/.sky/azure_container_auth.json'
+_CONTAINER_AUTH_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Operations of the container client used in the repo that are safe to retry
+# with credentials after failing anonymously.
+_AUTH_FALLBACK_METHODS = frozenset(
+    {'exists', 'list_blobs', 'get_container_properties', 'delete_blob'})
+# Shared across all clients so that the token acquired by `az` is reused
+# instead of spawning a new `az` subprocess for every new client.
+_cli_credential: Optional[Any] = None
+_sdk_preloaded = threading.Event()
+# Management client classes by client name, filled by _preload_sdk().
+_mgmt_client_classes: Dict[str, Any] = {}
 
 
 @common.load_lazy_modules(modules=_LAZY_MODULES)
@@ -69,6 +101,107 @@ def exceptions():
     return azure_exceptions
 
 
+def _preload_sdk() -> None:
+    """Imports the Azure SDK submodules used by get_client once.
+
+    This keeps the (slow) first imports out of _session_creation_lock, so that
+    concurrent get_client calls for different clients do not serialize on both
+    the lock and the per-module import locks. msgraph is left out as it is
+    only needed for role assignment and takes seconds to import. It also fills
+    the management client classes get_client dispatches to.
+    """
+    if _sdk_preloaded.is_set():
+        return
+    # pylint: disable=unused-import
+    from azure import identity
+    from azure.mgmt import authorization
+    from azure.mgmt import compute
+    from azure.mgmt import msi
+    from azure.mgmt import network
+    from azure.mgmt import resource
+    from azure.mgmt import storage
+    from azure.storage import blob
+    _mgmt_client_classes.update({
+        'compute': compute.ComputeManagementClient,
+        'network': network.NetworkManagementClient,
+        'resource': resource.ResourceManagementClient,
+        'storage': storage.StorageManagementClient,
+        'authorization': authorization.AuthorizationManagementClient,
+        'msi': msi.ManagedServiceIdentityClient,
+    })
+    _sdk_preloaded.set()
+
+
+@common.load_lazy_modules(modules=_LAZY_MODULES)
+def _get_credential() -> Any:
+    """Returns the AzureCliCredential shared by all the clients."""
+    global _cli_credential
+    if _cli_credential is None:
+        with _session_creation_lock:
+            if _cli_credential is None:
+                # Sky only supports Azure CLI credential for now.
+                # Increase the timeout to fix the Azure get-access-token
+                # timeout issue. Tracked in
+                # https://github.com/Azure/azure-cli/issues/20404#issuecomment-1249575110 # pylint: disable=line-too-long
+                from azure import identity
+                _cli_credential = _TokenCachingCredential(
+                    identity.AzureCliCredential(process_timeout=30))
+                # Fetch the token in the background, so that the `az`
+                # subprocess overlaps with other work instead of delaying
+                # the first call to Azure.
+                threading.Thread(target=_prefetch_token,
+                                 args=(_cli_credential,),
+                                 daemon=True).start()
+    return _cli_credential
+
+
+class _TokenCachingCredential:
+    """Credential that shares the access tokens across all the clients.
+
+    AzureCliCredential spawns an `az` subprocess for every get_token call and
+    does not cache the tokens itself, while each client only caches the
+    tokens it fetched on its own.
+    """
+
+    def __init__(self, credential: Any) -> None:
+        self._credential = credential
+        self._tokens: Dict[Tuple[str, ...], Any] = {}
+        self._scope_locks: Dict[Tuple[str, ...], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get_scope_lock(self, scopes: Tuple[str, ...]) -> threading.Lock:
+        with self._lock:
+            return self._scope_locks.setdefault(scopes, threading.Lock())
+
+    def get_token(self, *scopes: str, **kwargs) -> Any:
+        if any(
+                kwargs.get(key)
+                for key in ('claims', 'tenant_id', 'enable_cae')):
+            # Tokens with claims or for another tenant are not shared.
+            return self._credential.get_token(*scopes, **kwargs)
+        # Holding the lock of the scopes while fetching makes concurrent
+        # callers wait for the same `az` subprocess instead of spawning their
+        # own, without blocking the callers of other scopes.
+        with self._get_scope_lock(scopes):
+            token = self._tokens.get(scopes)
+            if (token is None or token.expires_on - time.time() <
+                    _TOKEN_REFRESH_MARGIN_SECONDS):
+                token = self._credential.get_token(*scopes)
+                self._tokens[scopes] = token
+            return token
+
+    def close(self) -> None:
+        self._credential.close()
+
+
+def _prefetch_token(credential: Any) -> None:
+    try:
+        credential.get_token(_MANAGEMENT_SCOPE)
+    except Exception as e:  # pylint: disable=broad-except
+        # The error will surface again on the actual call.
+        sky_logger.debug(f'Failed to prefetch the Azure token: {e}')
+
+
 @annotations.lru_cache(scope='global')
 @common.load_lazy_modules(modules=_LAZY_MODULES)
 def azure_mgmt_models(name: str):
@@ -83,13 +216,13 @@ def azure_mgmt_models(name: str):
 # We should keep the order of the decorators having 'lru_cache' followed
 # by 'load_lazy_modules' as we need to make sure a caller can call
 # 'get_client.cache_clear', which is a function provided by 'lru_cache'
-@annotations.lru_cache(scope='global')
+@annotations.lru_cache(scope='global', maxsize=32)
 @common.load_lazy_modules(modules=_LAZY_MODULES)
-def get_client(name: str,
-               subscription_id: Optional[str] = None,
-               **kwargs) -> Client:
+def get_client(name: str, subscription_id: Optional[str] = None) -> Client:
     """Creates and returns an Azure client for the specified service.
 
+    Use get_container_client() for the client of a storage container.
+
     Args:
         name: The type of Azure client to create.
         subscription_id: The Azure subscription ID. Defaults to None.
@@ -97,171 +230,355 @@ def get_client(name: str,
     Returns:
         An instance of the specified Azure client.
 
+    Raises:
+        ValueError: If an unsupported client type is specified.
+    """
+    _preload_sdk()
+    with _session_creation_lock:
+        credential = _get_credential()
+        if name == 'graph':
+            import msgraph
+            return msgraph.GraphServiceClient(credential)
+        client_class = _mgmt_client_classes.get(name)
+        if client_class is None:
+            raise ValueError(f'Client not supported: "{name}"')
+        return client_class(credential, subscription_id)
+
+
+@common.load_lazy_modules(modules=_LAZY_MODULES)
+def get_clients(names: Sequence[str],
+                subscription_id: Optional[str] = None) -> Dict[str, Client]:
+    """Creates and returns the Azure clients for the specified services.
+
+    The clients are created in a single acquisition of the session creation
+    lock and share the same credential. Each of them is cached by get_client.
+
+    Args:
+        names: The types of Azure clients to create.
+        subscription_id: The Azure subscription ID. Defaults to None.
+
+    Returns:
+        A dict mapping each of the names to its Azure client.
+
+    Raises:
+        ValueError: If an unsupported client type is specified.
+    """
+    _preload_sdk()
+    with _session_creation_lock:
+        return {name: get_client(name, subscription_id) for name in names}
+
+
+@annotations.lru_cache(scope='global', maxsize=256)
+@common.load_lazy_modules(modules=_LAZY_MODULES)
+def get_container_client(container_url: str,
+                         storage_account_name: str,
+                         resource_group_name: Optional[str] = None,
+                         subscription_id: Optional[str] = None) -> Client:
+    """Creates and returns the client of an Azure storage container.
+
+    Args:
+        container_url: The URL of the container.
+        storage_account_name: The storage account the container belongs to.
+        resource_group_name: The resource group of the storage account. Only
+            set for private containers the user has access to.
+        subscription_id: The Azure subscription ID. Defaults to None.
+
+    Returns:
+        A client of the container.
+
     Raises:
         NonExistentStorageAccountError: When storage account provided
             either through config.yaml or local db does not exist under
             user's subscription ID.
         StorageBucketGetError: If there is an error retrieving the container
             client or if a non-existent public container is specified.
-        ValueError: If an unsupported client type is specified.
         TimeoutError: If unable to get the container client within the
             specified time.
     """
-    # Sky only supports Azure CLI credential for now.
-    # Increase the timeout to fix the Azure get-access-token timeout issue.
-    # Tracked in
-    # https://github.com/Azure/azure-cli/issues/20404#issuecomment-1249575110
-    from azure import identity
-    with _session_creation_lock:
-        credential = identity.AzureCliCredential(process_timeout=30)
-        if name == 'compute':
-            from azure.mgmt import compute
-            return compute.ComputeManagementClient(credential, subscription_id)
-        elif name == 'network':
-            from azure.mgmt import network
-            return network.NetworkManagementClient(credential, subscription_id)
-        elif name == 'resource':
-            from azure.mgmt import resource
-            return resource.ResourceManagementClient(credential,
-                                                     subscription_id)
-        elif name == 'storage':
-            from azure.mgmt import storage
-            return storage.StorageManagementClient(credential, subscription_id)
-        elif name == 'authorization':
-            from azure.mgmt import authorization
-            return authorization.AuthorizationManagementClient(
-                credential, subscription_id)
-        elif name == 'msi':
-            from azure.mgmt import msi
-            return msi.ManagedServiceIdentityClient(credential, subscription_id)
-        elif name == 'graph':
-            import msgraph
-            return msgraph.GraphServiceClient(credential)
-        elif name == 'container':
-            # There is no direct way to check if a container URL is public or
-            # private. Attempting to access a private container without
-            # credentials or a public container with credentials throws an
-            # error. Therefore, we use a try-except block, first assuming the
-            # URL is for a public container. If an error occurs, we retry with
-            # credentials, assuming it's a private container.
-            # Reference: https://github.com/Azure/azure-sdk-for-python/issues/35770  # pylint: disable=line-too-long
-            # Note: Checking a private container without credentials is
-            # faster (~0.2s) than checking a public container with
-            # credentials (~90s).
-            from azure.mgmt import storage
-            from azure.storage import blob
-            container_url = kwargs.pop('container_url', None)
-            assert container_url is not None, ('Must provide container_url'
-                                               ' keyword arguments for '
-                                               'container client.')
-            storage_account_name = kwargs.pop('storage_account_name', None)
-            assert storage_account_name is not None, ('Must provide '
-                                                      'storage_account_name '
-                                                      'keyword arguments for '
-                                                      'container client.')
-
-            # Check if the given storage account exists. This separate check
-            # is necessary as running container_client.exists() with container
-            # url on non-existent storage account errors out after long lag(~90s)
-            storage_client = storage.StorageManagementClient(
-                credential, subscription_id)
-            storage_account_availability = (
-                storage_client.storage_accounts.check_name_availability(
-                    {'name': storage_account_name}))
-            if storage_account_availability.name_available:
+    # There is no direct way to check if a container URL is public or
+    # private. Attempting to access a private container without
+    # credentials or a public container with credentials throws an
+    # error. Therefore, we first assume the URL is for a public
+    # container. If an error occurs, we retry with credentials,
+    # assuming it's a private container.
+    # Reference: https://github.com/Azure/azure-sdk-for-python/issues/35770  # pylint: disable=line-too-long
+    # Note: Checking a private container without credentials is
+    # faster (~0.2s) than checking a public container with
+    # credentials (~90s).
+
+    # Check if the given storage account exists. This separate check
+    # is necessary as running container_client.exists() with container
+    # url on non-existent storage account errors out after long lag(~90s)
+    storage_client = get_client('storage', subscription_id)
+    storage_account_availability = (
+        storage_client.storage_accounts.check_name_availability(
+            {'name': storage_account_name}))
+    if storage_account_availability.name_available:
+        with ux_utils.print_exception_no_traceback():
+            raise sky_exceptions.NonExistentStorageAccountError(
+                f'The storage account {storage_account_name!r} does '
+                'not exist. Please check if the name is correct.')
+
+    # Assume the URL is from a public container and only switch to
+    # credentials once an operation on it fails with an
+    # authentication error. This saves the round trip of probing the
+    # container with exists() before returning the client.
+    return _LazyAuthContainerClient(container_url, storage_account_name,
+                                    resource_group_name)
+
+
+@common.load_lazy_modules(modules=_LAZY_MODULES)
+def _get_private_container_client(container_url: str, storage_account_name: str,
+                                  resource_group_name: Optional[str]) -> Client:
+    """Returns a credentialed client for a private container.
+
+    Assigns the Storage Blob Data Owner role to the user and waits for the
+    role assignment to propagate if the user lacks access to the container.
+    """
+    from azure.storage import blob
+    start_time = time.time()
+    role_assigned = False
+
+    while (time.time() - start_time <
+           constants.WAIT_FOR_STORAGE_ACCOUNT_ROLE_ASSIGNMENT):
+        container_client = blob.ContainerClient.from_container_url(
+            container_url, credential=_get_credential())
+        try:
+            # Suppress noisy logs from Azure SDK when attempting
+            # to run exists() on private container without access.
+            # Reference:
+            # https://github.com/Azure/azure-sdk-for-python/issues/9422
+            azure_logger = logging.getLogger('azure')
+            original_level = azure_logger.getEffectiveLevel()
+            azure_logger.setLevel(logging.CRITICAL)
+            container_client.exists()
+            azure_logger.setLevel(original_level)
+            return container_client
+        except exceptions().ClientAuthenticationError as e:
+            # Caught when user attempted to use private container
+            # without access rights. Raised error is handled at the
+            # upstream.
+            # Reference: https://learn.microsoft.com/en-us/troubleshoot/azure/entra/entra-id/app-integration/error-code-aadsts50020-user-account-identity-provider-does-not-exist # pylint: disable=line-too-long
+            if 'ERROR: AADSTS50020' in str(e):
                 with ux_utils.print_exception_no_traceback():
-                    raise sky_exceptions.NonExistentStorageAccountError(
-                        f'The storage account {storage_account_name!r} does '
-                        'not exist. Please check if the name is correct.')
+                    raise e
+            with ux_utils.print_exception_no_traceback():
+                raise sky_exceptions.StorageBucketGetError(
+                    'Failed to retreive the container client for the '
+                    f'container {container_client.container_name!r}. '
+                    f'Details: '
+                    f'{common_utils.format_exception(e, use_bracket=True)}')
+        except exceptions().HttpResponseError as e:
+            # Handle case where user lacks sufficient IAM role for
+            # a private container in the same subscription. Attempt to
+            # assign appropriate role to current user.
+            if 'AuthorizationPermissionMismatch' in str(e):
+                if not role_assigned:
+                    # resource_group_name is not None only for private
+                    # containers with user access.
+                    assert resource_group_name is not None, (
+                        'Must provide resource_group_name keyword '
+                        'arguments for container client.')
+                    sky_logger.info('Failed to check the existence of the '
+                                    f'container {container_url!r} due to '
+                                    'insufficient IAM role for storage '
+                                    f'account {storage_account_name!r}.')
+                    assign_storage_account_iam_role(
+                        storage_account_name=storage_account_name,
+                        resource_group_name=resource_group_name)
+                    role_assigned = True
+                else:
+                    sky_logger.info(
+                        'Waiting due to the propagation delay of IAM '
+                        'role assignment to the storage account '
+                        f'{storage_account_name!r}.')
+                    time.sleep(constants.RETRY_INTERVAL_AFTER_ROLE_ASSIGNMENT)
+                continue
+            with ux_utils.print_exception_no_traceback():
+                raise sky_exceptions.StorageBucketGetError(
+                    'Failed to retreive the container client for the '
+                    f'container {container_client.container_name!r}. '
+                    f'Details: '
+                    f'{common_utils.format_exception(e, use_bracket=True)}')
+    else:
+        raise TimeoutError(
+            'Failed to get the container client within '
+            f'{constants.WAIT_FOR_STORAGE_ACCOUNT_ROLE_ASSIGNMENT}'
+            ' seconds.')
+
+
+def _load_container_auth_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+    """Loads the unexpired entries of the cache, skipping malformed ones."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    now = time.time()
+    return {
+        url: entry
+        for url, entry in cache.items()
+        if _is_valid_container_auth_entry(entry, now)
+    }
+
+
+def _is_valid_container_auth_entry(entry: Any, now: float) -> bool:
+    if not isinstance(entry, dict) or not isinstance(entry.get('auth'), str):
+        return False
+    timestamp = entry.get('timestamp')
+    if not isinstance(timestamp, (int, float)):
+        return False
+    return now - timestamp <= _CONTAINER_AUTH_CACHE_TTL_SECONDS
+
+
+def _get_cached_container_auth(container_url: str) -> Optional[str]:
+    """Returns the cached classification of the container, if not expired."""
+    cache = _load_container_auth_cache(
+        os.path.expanduser(_CONTAINER_AUTH_CACHE_PATH))
+    entry = cache.get(container_url)
+    if entry is None:
+        return None
+    return entry['auth']
+
+
+def _set_cached_container_auth(container_url: str, auth: Optional[str]) -> None:
+    """Caches the classification of the container, or removes it if None."""
+    cache_path = os.path.expanduser(_CONTAINER_AUTH_CACHE_PATH)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with filelock.FileLock(cache_path + '.lock'):
+            cache = _load_container_auth_cache(cache_path)
+            now = time.time()
+            if auth is None:
+                cache.pop(container_url, None)
+            else:
+                cache[container_url] = {'auth': auth, 'timestamp': now}
+            tmp_cache_path = cache_path + '.tmp'
+            with open(tmp_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_cache_path, cache_path)
+    except OSError as e:
+        # The cache is only an optimization.
+        sky_logger.debug(f'Failed to update {cache_path}: {e}')
+
+
+class _LazyAuthContainerClient:
+    """Container client that falls back to credentials on demand.
+
+    Attempting to access a private container without credentials raises a
+    ClientAuthenticationError. Instead of probing the container upfront, the
+    anonymous client is used until one of the read/probe/delete operations in
+    _AUTH_FALLBACK_METHODS fails with that error, after which the operation
+    is retried once with a credentialed client. The upgrade is sticky for the
+    lifetime of the object.
+
+    Other operations are not safe to retry, e.g. uploads from a stream, and
+    list_blobs() only sends the request when its result is iterated. Before
+    the first of those, whether credentials are needed is resolved with an
+    exists() call, and the operation is then passed to the resolved client
+    as is.
+
+    Containers found to be private are recorded on disk, so that later
+    processes use the credentialed client directly.
+    """
 
-            # First, assume the URL is from a public container.
-            container_client = blob.ContainerClient.from_container_url(
-                container_url)
+    def __init__(self, container_url: str, storage_account_name: str,
+                 resource_group_name: Optional[str]) -> None:
+        from azure.storage import blob
+        self._container_url = container_url
+        self._storage_account_name = storage_account_name
+        self._resource_group_name = resource_group_name
+        self._inner = blob.ContainerClient.from_container_url(container_url)
+        self._authenticated = False
+        # Whether the client is known to work for the container, i.e. the
+        # container is public or the client has been authenticated.
+        self._resolved = False
+        self._known_private = (
+            _get_cached_container_auth(container_url) == 'private')
+
+    def _authenticate(self) -> None:
+        with _session_creation_lock:
+            if self._authenticated:
+                return
+            try:
+                self._inner = _get_private_container_client(
+                    self._container_url, self._storage_account_name,
+                    self._resource_group_name)
+            except Exception:
+                if self._known_private:
+                    # The cached classification may be stale, e.g. the
+                    # container became public, so try anonymously next time.
+                    _set_cached_container_auth(self._container_url, None)
+                raise
+            self._authenticated = True
+            self._resolved = True
+            if not self._known_private:
+                _set_cached_container_auth(self._container_url, 'private')
+
+    def _call_with_auth_fallback(self, name: str, *args, **kwargs) -> Any:
+        if self._known_private:
+            self._authenticate()
+        if not self._authenticated:
             try:
-                container_client.exists()
-                return container_client
+                result = getattr(self._inner, name)(*args, **kwargs)
+                self._resolved = True
+                return result
             except exceptions().ClientAuthenticationError:
-                pass
-
-            # If the URL is not for a public container, assume it's private
-            # and retry with credentials.
-            start_time = time.time()
-            role_assigned = False
-
-            while (time.time() - start_time <
-                   constants.WAIT_FOR_STORAGE_ACCOUNT_ROLE_ASSIGNMENT):
-                container_client = blob.ContainerClient.from_container_url(
-                    container_url, credential)
-                try:
-                    # Suppress noisy logs from Azure SDK when attempting
-                    # to run exists() on private container without access.
-                    # Reference:
-                    # https://github.com/Azure/azure-sdk-for-python/issues/9422
-                    azure_logger = logging.getLogger('azure')
-                    original_level = azure_logger.getEffectiveLevel()
-                    azure_logger.setLevel(logging.CRITICAL)
-                    container_client.exists()
-                    azure_logger.setLevel(original_level)
-                    return container_client
-                except exceptions().ClientAuthenticationError as e:
-                    # Caught when user attempted to use private container
-                    # without access rights. Raised error is handled at the
-                    # upstream.
-                    # Reference: https://learn.microsoft.com/en-us/troubleshoot/azure/entra/entra-id/app-integration/error-code-aadsts50020-user-account-identity-provider-does-not-exist # pylint: disable=line-too-long
-                    if 'ERROR: AADSTS50020' in str(e):
-                        with ux_utils.print_exception_no_traceback():
-                            raise e
-                    with ux_utils.print_exception_no_traceback():
-                        raise sky_exceptions.StorageBucketGetError(
-                            'Failed to retreive the container client for the '
-                            f'container {container_client.container_name!r}. '
-                            f'Details: '
-                            f'{common_utils.format_exception(e, use_bracket=True)}'
-                        )
-                except exceptions().HttpResponseError as e:
-                    # Handle case where user lacks sufficient IAM role for
-                    # a private container in the same subscription. Attempt to
-                    # assign appropriate role to current user.
-                    if 'AuthorizationPermissionMismatch' in str(e):
-                        if not role_assigned:
-                            # resource_group_name is not None only for private
-                            # containers with user access.
-                            resource_group_name = kwargs.pop(
-                                'resource_group_name', None)
-                            assert resource_group_name is not None, (
-                                'Must provide resource_group_name keyword '
-                                'arguments for container client.')
-                            sky_logger.info(
-                                'Failed to check the existence of the '
-                                f'container {container_url!r} due to '
-                                'insufficient IAM role for storage '
-                                f'account {storage_account_name!r}.')
-                            assign_storage_account_iam_role(
-                                storage_account_name=storage_account_name,
-                                resource_group_name=resource_group_name)
-                            role_assigned = True
-                        else:
-                            sky_logger.info(
-                                'Waiting due to the propagation delay of IAM '
-                                'role assignment to the storage account '
-                                f'{storage_account_name!r}.')
-                            time.sleep(
-                                constants.RETRY_INTERVAL_AFTER_ROLE_ASSIGNMENT)
-                        continue
-                    with ux_utils.print_exception_no_traceback():
-                        raise sky_exceptions.StorageBucketGetError(
-                            'Failed to retreive the container client for the '
-                            f'container {container_client.container_name!r}. '
-                            f'Details: '
-                            f'{common_utils.format_exception(e, use_bracket=True)}'
-                        )
-            else:
-                raise TimeoutError(
-                    'Failed to get the container client within '
-                    f'{constants.WAIT_FOR_STORAGE_ACCOUNT_ROLE_ASSIGNMENT}'
-                    ' seconds.')
-        else:
-            raise ValueError(f'Client not supported: "{name}"')
+                # The container is not public, retry with credentials.
+                self._authenticate()
+        return getattr(self._inner, name)(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if self._resolved or not callable(attr):
+            return attr
+        if name in _AUTH_FALLBACK_METHODS and name != 'list_blobs':
+            return functools.partial(self._call_with_auth_fallback, name)
+        # list_blobs() only fails when its result is iterated, and the other
+        # operations are not safe to retry, so resolve the client with
+        # exists() first and hand out the method of the resolved client.
+        self._call_with_auth_fallback('exists')
+        return getattr(self._inner, name)
+
+
+def _get_sas_expiry_bucket() -> int:
+    """Returns the index of the current SAS expiry bucket."""
+    return int(time.time() // _SAS_EXPIRY_BUCKET_SECONDS)
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_sas_expiry(expiry_bucket: int) -> datetime.datetime:
+    """Returns the expiry of the SAS tokens generated within the bucket.
+
+    Tokens expire two buckets after the end of the given one, so a cached
+    token is valid for at least an hour when handed out. The expiry is
+    cached, so it is only constructed once per bucket.
+    """
+    return datetime.datetime.fromtimestamp(
+        (expiry_bucket + 3) * _SAS_EXPIRY_BUCKET_SECONDS,
+        tz=datetime.timezone.utc)
+
+
+# The SAS permissions are only read when generating the tokens, so they are
+# created once and shared by all the tokens.
+@annotations.lru_cache(scope='global', maxsize=1)
+def _container_sas_permissions() -> Any:
+    from azure.storage import blob
+    return blob.ContainerSasPermissions(read=True,
+                                        write=True,
+                                        list=True,
+                                        create=True)
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _blob_sas_permissions() -> Any:
+    from azure.storage import blob
+    return blob.BlobSasPermissions(read=True,
+                                   write=True,
+                                   list=True,
+                                   create=True)
 
 
 @common.load_lazy_modules(modules=_LAZY_MODULES)
@@ -278,19 +595,23 @@ def get_az_container_sas_token(
         container_name: The name of the mounting container
 
     Returns:
-        An SAS token with a 1-hour lifespan to access the specified container.
+        An SAS token with a 60 to 90 minutes lifespan to access the specified
+        container.
     """
+    return _generate_container_sas(storage_account_name, storage_account_key,
+                                   container_name, _get_sas_expiry_bucket())
+
+
+@annotations.lru_cache(scope='global', maxsize=1024)
+def _generate_container_sas(storage_account_name: str, storage_account_key: str,
+                            container_name: str, expiry_bucket: int) -> str:
     from azure.storage import blob
     sas_token = blob.generate_container_sas(
         account_name=storage_account_name,
         container_name=container_name,
         account_key=storage_account_key,
-        permission=blob.ContainerSasPermissions(read=True,
-                                                write=True,
-                                                list=True,
-                                                create=True),
-        expiry=datetime.datetime.now(datetime.timezone.utc) +
-        datetime.timedelta(hours=1))
+        permission=_container_sas_permissions(),
+        expiry=_get_sas_expiry(expiry_bucket))
     return sas_token
 
 
@@ -307,20 +628,25 @@ def get_az_blob_sas_token(storage_account_name: str, storage_account_key: str,
         blob_name: path to the blob(file)
 
     Returns:
-        A SAS token with a 1-hour lifespan to access the specified blob.
+        A SAS token with a 60 to 90 minutes lifespan to access the specified
+        blob.
     """
+    expiry_bucket = _get_sas_expiry_bucket()
+    return _generate_blob_sas(storage_account_name, storage_account_key,
+                              container_name, blob_name, expiry_bucket)
+
+
+@annotations.lru_cache(scope='global', maxsize=1024)
+def _generate_blob_sas(storage_account_name: str, storage_account_key: str,
+                       container_name: str, blob_name: str,
+                       expiry_bucket: int) -> str:
     from azure.storage import blob
-    sas_token = blob.generate_blob_sas(
-        account_name=storage_account_name,
-        container_name=container_name,
-        blob_name=blob_name,
-        account_key=storage_account_key,
-        permission=blob.BlobSasPermissions(read=True,
-                                           write=True,
-                                           list=True,
-                                           create=True),
-        expiry=datetime.datetime.now(datetime.timezone.utc) +
-        datetime.timedelta(hours=1))
+    sas_token = blob.generate_blob_sas(account_name=storage_account_name,
+                                       container_name=container_name,
+                                       blob_name=blob_name,
+                                       account_key=storage_account_key,
+                                       permission=_blob_sas_permissions(),
+                                       expiry=_get_sas_expiry(expiry_bucket))
     return sas_token
 
 
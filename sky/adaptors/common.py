@@ -69,11 +69,17 @@ def load_lazy_modules(modules: Tuple[LazyImport, ...]):
     """Load lazy modules before entering a function to error out quickly."""
 
     def decorator(func):
+        # Once all the modules are loaded, they stay loaded, so the check is
+        # skipped for the subsequent calls.
+        loaded = False
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            for m in modules:
-                m.load_module()
+            nonlocal loaded
+            if not loaded:
+                for m in modules:
+                    m.load_module()
+                loaded = True
             return func(*args, **kwargs)
 
         return wrapper
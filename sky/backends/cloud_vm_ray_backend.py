@@ -3278,7 +3278,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                             stream_logs=stream_logs)
                         return stdout.strip()
 
-                    zones = subprocess_utils.run_in_parallel(_get_zone, runners)
+                    cloud_str = str(handle.launched_resources.cloud)
+                    num_threads = subprocess_utils.get_parallel_threads(
+                        cloud_str, io_bound=False)
+                    zones = subprocess_utils.run_in_parallel(
+                        _get_zone, runners, num_threads)
                     if len(set(zones)) == 1:
                         # zone will be checked during Resources cls
                         # initialization.
@@ -3476,8 +3480,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             f'{SKY_REMOTE_WORKDIR}{style.RESET_ALL}')
         os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
         os.system(f'touch {log_path}')
-        num_threads = subprocess_utils.get_parallel_threads(
-            str(handle.launched_resources.cloud))
+        cloud_str = str(handle.launched_resources.cloud)
+        num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                            io_bound=False)
         with rich_utils.safe_status(
                 ux_utils.spinner_message('Syncing workdir', log_path)):
             subprocess_utils.run_in_parallel(_sync_git_workdir_node, runners,
@@ -3532,8 +3537,10 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             f'{workdir} -> {SKY_REMOTE_WORKDIR}{style.RESET_ALL}')
         os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
         os.system(f'touch {log_path}')
-        num_threads = subprocess_utils.get_parallel_threads(
-            str(handle.launched_resources.cloud))
+        # rsync is not purely I/O-bound, see get_max_workers_for_file_mounts.
+        cloud_str = str(handle.launched_resources.cloud)
+        num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                            io_bound=False)
         with rich_utils.safe_status(
                 ux_utils.spinner_message('Syncing workdir', log_path)):
             subprocess_utils.run_in_parallel(_sync_workdir_node, runners,
@@ -3710,7 +3717,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # even if some of them raise exceptions. We should replace it with
         # multi-process.
         rich_utils.stop_safe_status()
-        subprocess_utils.run_in_parallel(_setup_node, list(range(num_nodes)))
+        cloud_str = str(handle.launched_resources.cloud)
+        num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                            io_bound=False)
+        subprocess_utils.run_in_parallel(_setup_node, list(range(num_nodes)),
+                                         num_threads)
 
         if detach_setup:
             # Only set this when setup needs to be run outside the self._setup()
@@ -4320,7 +4331,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         parallel_args = [[runner, *item]
                          for item in zip(local_log_dirs, remote_log_dirs)
                          for runner in runners]
-        subprocess_utils.run_in_parallel(_rsync_down, parallel_args)
+        cloud_str = str(handle.launched_resources.cloud)
+        num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                            io_bound=False)
+        subprocess_utils.run_in_parallel(_rsync_down, parallel_args,
+                                         num_threads)
         return dict(zip(job_ids, local_log_dirs))
 
     @context_utils.cancellation_guard
@@ -4605,7 +4620,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             parallel_args = [
                 (runner, local_log_dir, remote_log) for runner in runners
             ]
-            subprocess_utils.run_in_parallel(_rsync_down, parallel_args)
+            cloud_str = str(handle.launched_resources.cloud)
+            num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                                io_bound=False)
+            subprocess_utils.run_in_parallel(_rsync_down, parallel_args,
+                                             num_threads)
         else:  # download job logs
             local_log_dir = os.path.join(local_dir, 'managed_jobs',
                                          run_timestamp)
@@ -5642,8 +5661,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             return
         start = time.time()
         runners = handle.get_command_runners()
-        num_threads = subprocess_utils.get_parallel_threads(
-            str(handle.launched_resources.cloud))
+        cloud_str = str(handle.launched_resources.cloud)
+        num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                            io_bound=False)
         log_path = os.path.join(self.log_dir, 'storage_mounts.log')
 
         plural = 's' if len(storage_mounts) > 1 else ''
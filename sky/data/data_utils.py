@@ -189,6 +189,12 @@ def create_az_client(client_type: str, **kwargs: Any) -> Client:
     container_url = kwargs.pop('container_url', None)
     storage_account_name = kwargs.pop('storage_account_name', None)
     refresh_client = kwargs.pop('refresh_client', False)
+
+    if refresh_client:
+        azure.get_client.cache_clear()
+        azure.get_container_client.cache_clear()
+
+    subscription_id = azure.get_subscription_id()
     if client_type == 'container':
         # We do not assert on resource_group_name as it is set to None when the
         # container_url is for public container with user access.
@@ -197,17 +203,9 @@ def create_az_client(client_type: str, **kwargs: Any) -> Client:
         assert storage_account_name is not None, ('storage_account_name must '
                                                   'be provided for container '
                                                   'client')
-
-    if refresh_client:
-        azure.get_client.cache_clear()
-
-    subscription_id = azure.get_subscription_id()
-    client = azure.get_client(client_type,
-                              subscription_id,
-                              container_url=container_url,
-                              storage_account_name=storage_account_name,
-                              resource_group_name=resource_group_name)
-    return client
+        return azure.get_container_client(container_url, storage_account_name,
+                                          resource_group_name, subscription_id)
+    return azure.get_client(client_type, subscription_id)
 
 
 def verify_az_bucket(storage_account_name: str, container_name: str) -> bool:
@@ -3377,6 +3377,9 @@ class AzureBlobStore(AbstractStore):
                     container_url=container_url,
                     storage_account_name=self.storage_account_name,
                     resource_group_name=self.resource_group_name)
+                # The container client only resolves the credentials for
+                # private containers on its first operation.
+                container_exists = container_client.exists()
             except azure.exceptions().ClientAuthenticationError as e:
                 if 'ERROR: AADSTS50020' in str(e):
                     # Caught when failing to obtain container client due to
@@ -3387,7 +3390,7 @@ class AzureBlobStore(AbstractStore):
                                 _BUCKET_FAIL_TO_CONNECT_MESSAGE.format(
                                     name=self.name))
                 raise
-            if container_client.exists():
+            if container_exists:
                 is_private = (True if
                               container_client.get_container_properties().get(
                                   'public_access', None) is None else False)
@@ -370,8 +370,9 @@ def run_instances(region: str, cluster_name: str, cluster_name_on_cloud: str,
     provider_config = config.provider_config
     resource_group = provider_config['resource_group']
     subscription_id = provider_config['subscription_id']
-    compute_client = azure.get_client('compute', subscription_id)
-    network_client = azure.get_client('network', subscription_id)
+    clients = azure.get_clients(['compute', 'network'], subscription_id)
+    compute_client = clients['compute']
+    network_client = clients['network']
     instances_to_resume = []
     resumed_instance_ids: List[str] = []
     created_instance_ids: List[str] = []
@@ -601,8 +602,9 @@ def get_cluster_info(
     resource_group = provider_config['resource_group']
     subscription_id = provider_config.get('subscription_id',
                                           azure.get_subscription_id())
-    compute_client = azure.get_client('compute', subscription_id)
-    network_client = azure.get_client('network', subscription_id)
+    clients = azure.get_clients(['compute', 'network'], subscription_id)
+    compute_client = clients['compute']
+    network_client = clients['network']
 
     running_instances = _filter_instances(
         compute_client,
@@ -842,10 +844,12 @@ def delete_vm_and_attached_resources(subscription_id: str, resource_group: str,
                 cluster_name_on_cloud in resource.name):
             filtered_resources[resource.type].append(resource.name)
 
-    network_client = azure.get_client('network', subscription_id)
-    msi_client = azure.get_client('msi', subscription_id)
-    compute_client = azure.get_client('compute', subscription_id)
-    auth_client = azure.get_client('authorization', subscription_id)
+    clients = azure.get_clients(['network', 'msi', 'compute', 'authorization'],
+                                subscription_id)
+    network_client = clients['network']
+    msi_client = clients['msi']
+    compute_client = clients['compute']
+    auth_client = clients['authorization']
 
     delete_virtual_machine = _get_azure_sdk_function(
         client=compute_client.virtual_machines, function_name='delete')
@@ -262,8 +262,9 @@ def get_cluster_info(
     running_instances = _filter_instances(cluster_name_on_cloud, ['running'])
     instances: Dict[str, List[common.InstanceInfo]] = {}
 
-    subprocess_utils.run_in_parallel(get_internal_ip,
-                                     list(running_instances.values()))
+    subprocess_utils.run_in_parallel(
+        get_internal_ip, list(running_instances.values()),
+        subprocess_utils.get_parallel_threads(io_bound=False))
     head_instance_id = None
     for instance_id, instance_info in running_instances.items():
         instance_id = instance_info['id']
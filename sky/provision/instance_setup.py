@@ -158,7 +158,7 @@ def _parallel_ssh_with_cache(func,
         # Not using the default value of `max_workers` in ThreadPoolExecutor,
         # as 32 is too large for some machines.
         max_workers = subprocess_utils.get_parallel_threads(
-            cluster_info.provider_name)
+            cluster_info.provider_name, io_bound=False)
     with SSHThreadPoolExecutor(max_workers=max_workers) as pool:
         results = []
         runners = provision.get_command_runners(cluster_info.provider_name,
@@ -471,7 +471,7 @@ def start_ray_on_worker_nodes(cluster_name: str, no_restart: bool,
             source_bashrc=True)
 
     num_threads = subprocess_utils.get_parallel_threads(
-        cluster_info.provider_name)
+        cluster_info.provider_name, io_bound=False)
     results = subprocess_utils.run_in_parallel(
         _setup_ray_worker, list(zip(worker_runners, cache_ids)), num_threads)
     for returncode, stdout, stderr in results:
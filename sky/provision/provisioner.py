@@ -431,8 +431,10 @@ def wait_for_ssh(cluster_info: provision_common.ClusterInfo,
         ip = ips.popleft()
         ssh_port = ssh_ports.popleft()
         _retry_ssh_thread((ip, ssh_port))
+    num_threads = subprocess_utils.get_parallel_threads(
+        cluster_info.provider_name, io_bound=False)
     subprocess_utils.run_in_parallel(_retry_ssh_thread,
-                                     list(zip(ips, ssh_ports)))
+                                     list(zip(ips, ssh_ports)), num_threads)
 
 
 def _post_provision_setup(
@@ -1087,7 +1087,11 @@ def sync_down_logs(
                             ssh_mode=command_runner.SshMode.INTERACTIVE,
                             log_path=log_path)
 
+    # Each target runs an SSH command on the controller.
+    cloud_str = str(handle.launched_resources.cloud)
+    num_threads = subprocess_utils.get_parallel_threads(cloud_str,
+                                                        io_bound=False)
     subprocess_utils.run_in_parallel(sync_down_logs_by_target,
-                                     list(normalized_targets))
+                                     list(normalized_targets), num_threads)
 
     return local_dir
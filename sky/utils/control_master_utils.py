@@ -17,9 +17,7 @@ def is_tmp_9p_filesystem() -> bool:
     result = subprocess_utils.run(['df', '-T', '/tmp'],
                                   capture_output=True,
                                   text=True,
-                                  shell=None,
-                                  check=False,
-                                  executable=None)
+                                  check=False)
 
     if result.returncode != 0:
         return False
@@ -1,6 +1,6 @@
 """Utility functions for subprocesses."""
+import concurrent.futures
 import multiprocessing
-from multiprocessing import pool
 import os
 import random
 import resource
@@ -33,13 +33,32 @@ logger = sky_logging.init_logger(__name__)
 
 _fd_limit_warning_shown = False
 
+# The grace period for the processes to exit after SIGTERM in
+# kill_children_processes, before they are force killed.
+_KILL_GRACE_PERIOD_SECONDS = 10
+# Upper bound of the threads for I/O-bound tasks, same as the default of
+# concurrent.futures.ThreadPoolExecutor.
+_MAX_IO_BOUND_THREADS = 32
+
+# Whether to color the error messages of failed commands, following the
+# NO_COLOR convention (https://no-color.org). A tty check is not used, as the
+# errors raised on the API server are shown in the terminal of the client.
+_COLOR_ERROR_MSG = not os.environ.get('NO_COLOR')
+
+# The bounds of the backoff between retries in run_with_retries.
+_RETRY_BASE_BACKOFF_SECONDS = 0.1
+_RETRY_MAX_BACKOFF_SECONDS = 10
+
 
 @timeline.event
 def run(cmd, **kwargs):
     # Should be careful to use this function, as the child process cmd spawn may
     # keep running in the background after the current program is killed. To get
     # rid of this problem, use `log_lib.run_with_log`.
-    shell = kwargs.pop('shell', True)
+    # A string cmd runs in bash by default. A list cmd is executed directly
+    # unless the caller explicitly passes shell=True, which avoids spawning
+    # bash for commands that do not need any shell features.
+    shell = kwargs.pop('shell', not isinstance(cmd, list))
     check = kwargs.pop('check', True)
     executable = kwargs.pop('executable', '/bin/bash')
     if not shell:
@@ -90,34 +109,48 @@ def get_max_workers_for_file_mounts(common_file_mounts: Dict[str, str],
 
     max_workers = (fd_limit - fd_reserve) // fd_per_rsync
     # At least 1 worker, and avoid too many workers overloading the system.
-    num_threads = get_parallel_threads(cloud_str)
+    # rsync over ssh spends CPU on compression and encryption, so do not size
+    # the workers for I/O-bound tasks.
+    num_threads = get_parallel_threads(cloud_str, io_bound=False)
     max_workers = min(max(max_workers, 1), num_threads)
     logger.debug(f'Using {max_workers} workers for file mounts.')
     return max_workers
 
 
-def get_parallel_threads(cloud_str: Optional[str] = None) -> int:
+def get_parallel_threads(cloud_str: Optional[str] = None,
+                         io_bound: bool = True) -> int:
     """Returns the number of threads to use for parallel execution.
 
     Args:
         cloud_str: The cloud
+        io_bound: Whether the tasks mostly block on I/O, e.g. cloud API calls.
+          If so, the threads are not limited by the number of CPUs, similar to
+          the default of ThreadPoolExecutor. SSH commands and rsync also use
+          local CPU, so they are not considered I/O-bound.
     """
     cpu_count = os.cpu_count()
     if cpu_count is None:
         cpu_count = 1
-    return max(4, cpu_count - 1) * _get_thread_multiplier(cloud_str)
+    num_threads = max(4, cpu_count - 1) * _get_thread_multiplier(cloud_str)
+    if io_bound:
+        io_bound_threads = min(_MAX_IO_BOUND_THREADS, cpu_count * 5)
+        num_threads = max(num_threads, io_bound_threads)
+    return num_threads
 
 
 def run_in_parallel(func: Callable,
                     args: Union[List[Any], Set[Any]],
-                    num_threads: Optional[int] = None) -> List[Any]:
+                    num_threads: Optional[int] = None,
+                    io_bound: bool = True) -> List[Any]:
     """Run a function in parallel on a list of arguments.
 
     Args:
         func: The function to run in parallel
         args: Iterable of arguments to pass to func
         num_threads: Number of threads to use. If None, uses
-          get_parallel_threads()
+          get_parallel_threads(io_bound=io_bound)
+        io_bound: Whether func mostly blocks on I/O. Only used when
+          num_threads is None.
 
     Returns:
       A list of the return values of the function func, in the same order as the
@@ -132,12 +165,27 @@ def run_in_parallel(func: Callable,
     if len(args) == 1:
         return [func(list(args)[0])]
 
-    processes = (num_threads
-                 if num_threads is not None else get_parallel_threads())
+    processes = (num_threads if num_threads is not None else
+                 get_parallel_threads(io_bound=io_bound))
 
-    with pool.ThreadPool(processes=processes) as p:
-        ordered_iterators = p.imap(func, args)
-        return list(ordered_iterators)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=processes)
+    futures = [executor.submit(func, arg) for arg in args]
+    try:
+        # Raise the first exception as soon as it happens, instead of
+        # waiting for the tasks before it to finish.
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+    except BaseException:
+        # Cancel the tasks that have not started yet and raise immediately,
+        # without blocking on the running ones.
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        # All the tasks have finished unless a task failed or the call was
+        # interrupted, e.g. by KeyboardInterrupt, so do not wait for them.
+        executor.shutdown(wait=False)
+    return [future.result() for future in futures]
 
 
 def handle_returncode(returncode: int,
@@ -154,18 +202,21 @@ def handle_returncode(returncode: int,
         stderr: The stderr of the command.
         stream_logs: Whether to stream logs.
     """
+    if returncode == 0:
+        return
     echo = logger.error if stream_logs else logger.debug
-    if returncode != 0:
-        if stderr is not None:
-            echo(stderr)
+    if stderr is not None:
+        echo(stderr)
 
-        if callable(error_msg):
-            error_msg = error_msg()
+    if callable(error_msg):
+        error_msg = error_msg()
+    format_err_msg = error_msg
+    if _COLOR_ERROR_MSG:
         format_err_msg = (
             f'{colorama.Fore.RED}{error_msg}{colorama.Style.RESET_ALL}')
-        with ux_utils.print_exception_no_traceback():
-            raise exceptions.CommandError(returncode, command, format_err_msg,
-                                          stderr)
+    with ux_utils.print_exception_no_traceback():
+        raise exceptions.CommandError(returncode, command, format_err_msg,
+                                      stderr)
 
 
 def kill_children_processes(parent_pids: Optional[Union[
@@ -201,13 +252,51 @@ def kill_children_processes(parent_pids: Optional[Union[
                 continue
             parent_processes.append(process)
 
+    # Each parent and its children are signaled in one batch and share a
+    # single grace period, instead of waiting for each process in serial.
+    # The groups are still killed one after another, so that the order of
+    # ``parent_pids`` is preserved.
+    killed_pids: Set[int] = set()
     for parent_process in parent_processes:
-        child_processes = parent_process.children(recursive=True)
-        if parent_pids is not None:
-            kill_process_with_grace_period(parent_process, force=force)
-        logger.debug(f'Killing child processes: {child_processes}')
-        for child in child_processes:
-            kill_process_with_grace_period(child, force=force)
+        try:
+            child_processes = parent_process.children(recursive=True)
+        except psutil.NoSuchProcess:
+            child_processes = []
+        targets = [parent_process] if parent_pids is not None else []
+        targets.extend(child_processes)
+        targets = [proc for proc in targets if proc.pid not in killed_pids]
+        if not targets:
+            continue
+        killed_pids.update(proc.pid for proc in targets)
+        _kill_processes_with_grace_period(targets, force=force)
+
+
+def _kill_processes_with_grace_period(processes: List['psutil.Process'],
+                                      force: bool) -> None:
+    """Signals the processes and force kills them after the grace period."""
+    logger.debug(f'Killing processes: {[proc.pid for proc in processes]}')
+    _signal_processes(processes, force=force)
+    _, alive = psutil.wait_procs(processes, timeout=_KILL_GRACE_PERIOD_SECONDS)
+    if alive and not force:
+        logger.debug(f'Processes {[proc.pid for proc in alive]} did not '
+                     f'terminate after {_KILL_GRACE_PERIOD_SECONDS} seconds. '
+                     'Force killing them.')
+        _signal_processes(alive, force=True)
+        # Shorter timeout after force kill
+        psutil.wait_procs(alive, timeout=5)
+
+
+def _signal_processes(processes: List['psutil.Process'], force: bool) -> None:
+    """Sends SIGKILL if force, otherwise SIGTERM, to the processes in order."""
+    for proc in processes:
+        try:
+            if force:
+                proc.kill()
+            else:
+                proc.terminate()
+        except psutil.NoSuchProcess:
+            # The process may have already been terminated.
+            continue
 
 
 GenericProcess = Union[multiprocessing.Process, psutil.Process,
@@ -226,7 +315,11 @@ def kill_process_with_grace_period(proc: GenericProcess,
         grace_period: The grace period seconds to wait for the process to exit.
     """
     if isinstance(proc, psutil.Process):
-        alive = proc.is_running
+        # psutil.Process.terminate() already checks that the process is still
+        # running and raises NoSuchProcess otherwise, which is handled below,
+        # so skip the extra check for it. The forced kill in finally still
+        # checks, to skip the processes that exited after SIGTERM.
+        alive = proc.is_running if force else (lambda: True)
         wait = proc.wait
     elif isinstance(proc, subprocess.Popen):
         alive = lambda: proc.poll() is None
@@ -277,33 +370,29 @@ def run_with_retries(
         The returncode, stdout, and stderr of the command.
     """
     retry_cnt = 0
+    backoff = _RETRY_BASE_BACKOFF_SECONDS
     while True:
         returncode, stdout, stderr = log_lib.run_with_log(cmd,
                                                           '/dev/null',
                                                           require_outputs=True,
                                                           shell=True)
-        if retry_cnt < max_retry:
-            if (retry_returncode is not None and
-                    returncode in retry_returncode):
-                logger.debug(
-                    f'Retrying command due to returncode {returncode}: {cmd}')
-                retry_cnt += 1
-                time.sleep(random.uniform(0, 1) * 2)
-                continue
-
-            if retry_stderrs is None:
-                break
-
-            need_retry = False
-            for retry_err in retry_stderrs:
-                if retry_err in stderr:
-                    retry_cnt += 1
-                    time.sleep(random.uniform(0, 1) * 2)
-                    need_retry = True
-                    break
-            if need_retry:
-                continue
-        break
+        if retry_cnt >= max_retry or (retry_returncode is None and
+                                      retry_stderrs is None):
+            break
+        if retry_returncode is not None and returncode in retry_returncode:
+            logger.debug(
+                f'Retrying command due to returncode {returncode}: {cmd}')
+        elif retry_stderrs is not None and any(
+                retry_err in stderr for retry_err in retry_stderrs):
+            logger.debug(f'Retrying command due to stderr: {cmd}')
+        else:
+            break
+        retry_cnt += 1
+        # Decorrelated jitter: retry quickly on transient failures while
+        # backing off exponentially on sustained ones.
+        backoff = min(_RETRY_MAX_BACKOFF_SECONDS,
+                      random.uniform(_RETRY_BASE_BACKOFF_SECONDS, backoff * 3))
+        time.sleep(backoff)
     return returncode, stdout, stderr
 
 
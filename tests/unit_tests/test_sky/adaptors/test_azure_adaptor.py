@@ -0,0 +1,121 @@
+"""Tests for Azure adaptor."""
+
+import datetime
+from unittest import mock
+
+import pytest
+
+from sky.adaptors import azure
+
+
+def test_sas_token_cached_within_expiry_bucket():
+    """SAS tokens are reused within a bucket and refreshed across buckets."""
+    bucket_seconds = azure._SAS_EXPIRY_BUCKET_SECONDS
+    azure._generate_container_sas.cache_clear()
+    with mock.patch('azure.storage.blob.generate_container_sas',
+                    side_effect=['token1', 'token2']) as mock_generate, \
+            mock.patch('time.time') as mock_time:
+        mock_time.return_value = 10 * bucket_seconds + 1
+        token1 = azure.get_az_container_sas_token('account', 'key', 'container')
+        mock_time.return_value = 11 * bucket_seconds - 1
+        token2 = azure.get_az_container_sas_token('account', 'key', 'container')
+        assert token1 == token2 == 'token1'
+        assert mock_generate.call_count == 1
+
+        mock_time.return_value = 11 * bucket_seconds
+        token3 = azure.get_az_container_sas_token('account', 'key', 'container')
+        assert token3 == 'token2'
+        assert mock_generate.call_count == 2
+
+    expiry = mock_generate.call_args.kwargs['expiry']
+    assert expiry == datetime.datetime.fromtimestamp(14 * bucket_seconds,
+                                                     tz=datetime.timezone.utc)
+
+
+def test_token_caching_credential():
+    """Tokens are shared until they are about to expire."""
+    inner = mock.MagicMock()
+    inner.get_token.side_effect = [
+        mock.MagicMock(token='token1', expires_on=1000 + 3600),
+        mock.MagicMock(token='token2', expires_on=4000 + 3600),
+        mock.MagicMock(token='token3', expires_on=4000 + 3600),
+    ]
+    credential = azure._TokenCachingCredential(inner)
+    with mock.patch('time.time', return_value=1000):
+        assert credential.get_token('scope').token == 'token1'
+        assert credential.get_token('scope').token == 'token1'
+    assert inner.get_token.call_count == 1
+
+    # Refreshed when the token expires within the refresh margin.
+    with mock.patch('time.time', return_value=4400):
+        assert credential.get_token('scope').token == 'token2'
+    assert inner.get_token.call_count == 2
+
+    # Tokens with claims are never cached.
+    assert credential.get_token('scope', claims='claims').token == 'token3'
+    assert inner.get_token.call_count == 3
+
+
+def test_container_auth_cache(tmp_path, monkeypatch):
+    """Container classification is persisted with a TTL and invalidated."""
+    monkeypatch.setattr(azure, '_CONTAINER_AUTH_CACHE_PATH',
+                        str(tmp_path / 'azure_container_auth.json'))
+    url = 'https://account.blob.core.windows.net/container'
+    assert azure._get_cached_container_auth(url) is None
+
+    azure._set_cached_container_auth(url, 'private')
+    assert azure._get_cached_container_auth(url) == 'private'
+
+    with mock.patch('time.time',
+                    return_value=datetime.datetime.now().timestamp() +
+                    azure._CONTAINER_AUTH_CACHE_TTL_SECONDS + 1):
+        assert azure._get_cached_container_auth(url) is None
+
+    azure._set_cached_container_auth(url, None)
+    assert azure._get_cached_container_auth(url) is None
+
+
+@pytest.mark.parametrize('content', [
+    '[]',
+    '"private"',
+    '{"url": "private"}',
+    '{"url": {"auth": "private"}}',
+    '{"url": {"auth": "private", "timestamp": "now"}}',
+    '{"url": {"timestamp": 0}}',
+])
+def test_container_auth_cache_malformed(tmp_path, monkeypatch, content):
+    """Malformed caches are treated as misses and replaced on write."""
+    cache_path = tmp_path / 'azure_container_auth.json'
+    monkeypatch.setattr(azure, '_CONTAINER_AUTH_CACHE_PATH', str(cache_path))
+    cache_path.write_text(content, encoding='utf-8')
+    assert azure._get_cached_container_auth('url') is None
+
+    azure._set_cached_container_auth('other_url', 'private')
+    assert azure._get_cached_container_auth('url') is None
+    assert azure._get_cached_container_auth('other_url') == 'private'
+
+
+def test_lazy_auth_container_client_fallback(tmp_path, monkeypatch):
+    """Only allowlisted operations are retried with credentials."""
+    from azure.core import exceptions as azure_exceptions
+    monkeypatch.setattr(azure, '_CONTAINER_AUTH_CACHE_PATH',
+                        str(tmp_path / 'azure_container_auth.json'))
+    anonymous_client = mock.MagicMock()
+    anonymous_client.exists.side_effect = (
+        azure_exceptions.ClientAuthenticationError('no authentication'))
+    private_client = mock.MagicMock()
+    with mock.patch('azure.storage.blob.ContainerClient.from_container_url',
+                    return_value=anonymous_client), \
+            mock.patch.object(azure, '_get_private_container_client',
+                              return_value=private_client) as mock_private:
+        client = azure._LazyAuthContainerClient('url', 'account', 'group')
+        # Non-allowlisted operations are resolved with exists() first and
+        # sent once to the resolved client.
+        data = mock.MagicMock()
+        client.upload_blob('blob', data)
+        anonymous_client.upload_blob.assert_not_called()
+        private_client.upload_blob.assert_called_once_with('blob', data)
+        mock_private.assert_called_once()
+
+        assert client.list_blobs is private_client.list_blobs
+        assert azure._get_cached_container_auth('url') == 'private'
@@ -0,0 +1,23 @@
+"""Tests for the common utilities of adaptors."""
+
+from unittest import mock
+
+import pytest
+
+from sky.adaptors import common
+
+
+def test_load_lazy_modules_loads_once():
+    """Modules are only loaded until the first successful load."""
+    module = mock.MagicMock(spec=common.LazyImport)
+    module.load_module.side_effect = [ImportError('not installed'), None]
+
+    @common.load_lazy_modules(modules=(module,))
+    def func(x):
+        return x + 1
+
+    with pytest.raises(ImportError):
+        func(1)
+    assert func(1) == 2
+    assert func(2) == 3
+    assert module.load_module.call_count == 2
@@ -2,6 +2,8 @@
 import logging
 import multiprocessing
 import signal
+import subprocess
+import sys
 import time
 import unittest
 from unittest import mock
@@ -9,6 +11,7 @@ from unittest import mock
 import psutil
 import pytest
 
+from sky import exceptions
 from sky.utils import subprocess_utils
 
 logger = logging.getLogger(__name__)
@@ -289,3 +292,189 @@ class TestKillProcessWithGrace(unittest.TestCase):
         # Process should be terminated by SIGKILL after grace period
         time.sleep(0.1)  # Give some time for the process to be fully terminated
         self.assertFalse(process.is_alive())
+
+
+def _spawn_children_ignoring_sigterm(num_children: int):
+    """Process function that spawns children which ignore SIGTERM."""
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    child_script = ('import signal, time; '
+                    'signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+                    'time.sleep(30)')
+    for _ in range(num_children):
+        subprocess.Popen([sys.executable, '-c', child_script])
+    time.sleep(30)
+
+
+def _is_terminated(proc: psutil.Process) -> bool:
+    try:
+        return (not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE)
+    except psutil.NoSuchProcess:
+        return True
+
+
+def test_kill_children_processes_shares_grace_period():
+    """Processes are signaled in one batch and share the grace period."""
+    num_children = 8
+    parent = multiprocessing.Process(target=_spawn_children_ignoring_sigterm,
+                                     args=(num_children,))
+    parent.start()
+    parent_proc = psutil.Process(parent.pid)
+    try:
+        start_time = time.time()
+        while (len(parent_proc.children()) < num_children and
+               time.time() - start_time < 10):
+            time.sleep(0.1)
+        children = parent_proc.children(recursive=True)
+        assert len(children) == num_children
+
+        with mock.patch.object(subprocess_utils, '_KILL_GRACE_PERIOD_SECONDS',
+                               1):
+            start_time = time.time()
+            subprocess_utils.kill_children_processes(parent.pid)
+            elapsed = time.time() - start_time
+
+        # Killing the processes one by one would take at least one grace
+        # period for each of them, while in batch it takes at most one grace
+        # period plus the 5 seconds wait after force kill.
+        assert elapsed < 7
+        assert _is_terminated(parent_proc)
+        for child in children:
+            assert _is_terminated(child)
+    finally:
+        if parent.is_alive():
+            parent.kill()
+        parent.join()
+
+
+def test_kill_children_processes_preserves_parent_order():
+    """Each parent group is killed before the next parent is signaled."""
+    events = []
+
+    def _make_process(pid, children=()):
+        proc = mock.MagicMock(pid=pid)
+        proc.children.return_value = list(children)
+        proc.terminate.side_effect = lambda: events.append(('terminate', pid))
+        return proc
+
+    first = _make_process(1, [_make_process(11)])
+    second = _make_process(2, [_make_process(21)])
+    processes = {1: first, 2: second}
+
+    def _wait_procs(procs, timeout):
+        del timeout
+        events.append(('wait', sorted(proc.pid for proc in procs)))
+        return procs, []
+
+    with mock.patch('psutil.Process', side_effect=processes.__getitem__), \
+            mock.patch('psutil.wait_procs', side_effect=_wait_procs):
+        subprocess_utils.kill_children_processes([1, 2])
+
+    assert events == [
+        ('terminate', 1),
+        ('terminate', 11),
+        ('wait', [1, 11]),
+        ('terminate', 2),
+        ('terminate', 21),
+        ('wait', [2, 21]),
+    ]
+
+
+def test_run_in_parallel_preserves_order():
+    """Results are returned in the order of the arguments."""
+
+    def _delayed_identity(x):
+        time.sleep(0.01 * (5 - x))
+        return x
+
+    assert subprocess_utils.run_in_parallel(_delayed_identity,
+                                            list(range(5))) == list(range(5))
+
+
+def test_run_in_parallel_cancels_pending_tasks_on_failure():
+    """The failure is raised immediately and queued tasks are cancelled."""
+    started = []
+
+    def _func(x):
+        started.append(x)
+        if x == 1:
+            raise ValueError('task failed')
+        time.sleep(1)
+        return x
+
+    start_time = time.time()
+    with pytest.raises(ValueError, match='task failed'):
+        subprocess_utils.run_in_parallel(_func, list(range(10)), num_threads=3)
+    # The failure does not wait for the running tasks to finish.
+    assert time.time() - start_time < 0.5
+    # Let the running tasks finish, then check the queued ones never started.
+    time.sleep(1.5)
+    assert len(started) <= 4
+
+
+@pytest.mark.parametrize('cpu_count,io_bound,expected', [
+    (2, False, 4),
+    (16, False, 15),
+    (2, True, 10),
+    (4, True, 20),
+    (16, True, 32),
+    (64, True, 63),
+    (None, True, 5),
+])
+def test_get_parallel_threads(cpu_count, io_bound, expected):
+    """I/O-bound tasks get more threads than CPU-bound ones."""
+    with mock.patch('os.cpu_count', return_value=cpu_count):
+        assert subprocess_utils.get_parallel_threads(
+            io_bound=io_bound) == expected
+
+
+def test_run_with_retries_backoff(mock_sleep):
+    """Retries back off with jitter bounded by the base and max backoff."""
+    with mock.patch('sky.skylet.log_lib.run_with_log',
+                    return_value=(255, '', 'connection reset')) as mock_run:
+        returncode, _, _ = subprocess_utils.run_with_retries(
+            'echo hi', max_retry=20, retry_stderrs=['connection reset'])
+    assert returncode == 255
+    assert mock_run.call_count == 21
+    sleeps = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(sleeps) == 20
+    assert all(subprocess_utils._RETRY_BASE_BACKOFF_SECONDS <= sleep <=
+               subprocess_utils._RETRY_MAX_BACKOFF_SECONDS for sleep in sleeps)
+
+
+def test_run_with_retries_no_retry_conditions(mock_sleep):
+    """The command runs once when no retry condition is given."""
+    with mock.patch('sky.skylet.log_lib.run_with_log',
+                    return_value=(1, '', 'error')) as mock_run:
+        subprocess_utils.run_with_retries('false')
+    mock_run.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_run_list_cmd_without_shell():
+    """List commands are executed directly unless shell=True is passed."""
+    with mock.patch('subprocess.run') as mock_run:
+        subprocess_utils.run(['echo', 'hi'])
+        assert mock_run.call_args.kwargs['shell'] is False
+        assert mock_run.call_args.kwargs['executable'] is None
+
+        subprocess_utils.run('echo hi')
+        assert mock_run.call_args.kwargs['shell'] is True
+        assert mock_run.call_args.kwargs['executable'] == '/bin/bash'
+
+        subprocess_utils.run(['echo hi'], shell=True)
+        assert mock_run.call_args.kwargs['shell'] is True
+        assert mock_run.call_args.kwargs['executable'] == '/bin/bash'
+
+
+@pytest.mark.parametrize('color', [True, False])
+def test_handle_returncode_color(color):
+    """Error messages are only colored when colors are enabled."""
+    subprocess_utils.handle_returncode(0, 'true', 'unused')
+    with mock.patch.object(subprocess_utils, '_COLOR_ERROR_MSG', color):
+        with pytest.raises(exceptions.CommandError) as e:
+            subprocess_utils.handle_returncode(1,
+                                               'false',
+                                               lambda: 'command failed',
+                                               stream_logs=False)
+    assert ('\x1b[' in e.value.error_msg) == color
+    assert 'command failed' in e.value.error_msg